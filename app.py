@@ -82,23 +82,7 @@ def add_round():
     try:
         game.add_round(bids, tricks)
         hand_size = game.get_current_hand_size()
-        game_complete = hand_size is None
-        
-        # Save game state after each round
-        game_id = session.get('game_id')
-        if game_id and not game_complete:
-            _save_current_game_state(game_id, game)
-        
-        # If game is complete, save to history and clear current state
-        if game_complete:
-            game_data = {
-                'players': game.players,
-                'scores': game.get_current_scores(),
-                'rounds': game.rounds,
-                'max_cards': game.max_cards
-            }
-            history_id = game_history.save_completed_game(game_data)
-            game_state.clear_game_state()
+        game_complete = _save_or_complete_game(game)
         
         return jsonify({
             'success': True,
@@ -180,6 +164,71 @@ def undo_round():
         return jsonify({'error': str(e)}), 400
 
 
+@app.route('/api/redo_round', methods=['POST'])
+def redo_round():
+    """Redo the most recently undone round."""
+    game = _get_current_game()
+    if isinstance(game, tuple):  # Error response
+        return game
+    
+    try:
+        redone_round = game.redo_round()
+        hand_size = game.get_current_hand_size()
+        game_complete = _save_or_complete_game(game)
+        
+        return jsonify({
+            'success': True,
+            'redone_round': redone_round,
+            'scores': game.get_current_scores(),
+            'rounds': game.rounds,
+            'hand_size': hand_size,
+            'dealer': game.get_current_dealer() if hand_size else None,
+            'current_round': game.current_round_num,
+            'game_complete': game_complete
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+
+@app.route('/api/edit_round', methods=['POST'])
+def edit_round():
+    """Replace the bids and tricks of an earlier round."""
+    game = _get_current_game()
+    if isinstance(game, tuple):  # Error response
+        return game
+    
+    # Completed games have already been saved to history
+    if game.get_current_hand_size() is None:
+        return jsonify({'error': 'Cannot edit rounds of a completed game'}), 400
+    
+    data = request.json
+    round_num = data.get('round_num')
+    bids = data.get('bids', {})
+    tricks = data.get('tricks', {})
+    
+    try:
+        previous_round = game.edit_round(round_num, bids, tricks)
+        hand_size = game.get_current_hand_size()
+        
+        # Persist only the edited round, or the whole game if the saved
+        # state belongs to another game
+        game_id = session.get('game_id')
+        if game_id and not game_state.update_round(game_id, round_num, game.rounds[round_num - 1]):
+            _save_current_game_state(game_id, game)
+        
+        return jsonify({
+            'success': True,
+            'previous_round': previous_round,
+            'scores': game.get_current_scores(),
+            'rounds': game.rounds,
+            'hand_size': hand_size,
+            'dealer': game.get_current_dealer() if hand_size else None,
+            'current_round': game.current_round_num
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+
 @app.route('/api/reset', methods=['POST'])
 def reset():
     """Reset the current game."""
@@ -199,6 +248,19 @@ def get_history():
     return jsonify({'games': history})
 
 
+@app.route('/api/history/search', methods=['GET'])
+def search_history():
+    """Find completed games by player, opponents, date range and player count."""
+    results = game_history.query_games(
+        player=request.args.get('player'),
+        opponents=request.args.getlist('opponent'),
+        start=request.args.get('start'),
+        end=request.args.get('end'),
+        player_count=request.args.get('player_count', type=int)
+    )
+    return jsonify({'games': results})
+
+
 @app.route('/api/history/<game_id>', methods=['GET'])
 def get_history_game(game_id):
     """Get a specific game from history."""
@@ -252,6 +314,29 @@ def _save_current_game_state(game_id, game):
     game_state.save_game_state(state_data)
 
 
+def _save_or_complete_game(game):
+    """Save game state, or move the game to history if it is complete."""
+    game_complete = game.get_current_hand_size() is None
+    
+    # Save game state after each round
+    game_id = session.get('game_id')
+    if game_id and not game_complete:
+        _save_current_game_state(game_id, game)
+    
+    # If game is complete, save to history and clear current state
+    if game_complete:
+        game_data = {
+            'players': game.players,
+            'scores': game.get_current_scores(),
+            'rounds': game.rounds,
+            'max_cards': game.max_cards
+        }
+        game_history.save_completed_game(game_data)
+        game_state.clear_game_state()
+    
+    return game_complete
+
+
 def _print_startup_message():
     """Print server startup information."""
     print("\n" + "=" * 60)
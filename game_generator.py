@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Synthetic Game Generator
+Produces large volumes of rule-valid completed games for fuzzing and
+capacity testing, in the same record format as the game history store.
+Requires NumPy.
+"""
+import argparse
+import json
+from datetime import datetime, timedelta
+from typing import Iterator, List, Dict, Any
+
+import numpy as np
+
+from oh_hell_scorer import OhHellGame
+
+# Player counts the app accepts, and the deck every hand is dealt from
+MIN_PLAYERS = 3
+MAX_PLAYERS = 7
+DECK_SIZE = 52
+
+DEFAULT_PLAYERS = ['Alice', 'Bob', 'Carol', 'Dave', 'Erin', 'Frank', 'Grace', 'Heidi', 'Ivan', 'Judy']
+
+# Completion time of the most recent game when a seed is given, so seeded
+# output (including ids and timestamps) is fully reproducible
+SEEDED_END = datetime(2026, 1, 1, 20, 0, 0)
+
+# Chance a player's bid is one below / exactly / one above the tricks they win
+BID_ERROR_PROBS = [0.2, 0.6, 0.2]
+
+
+def generate_games(num_games: int,
+                   player_pool: List[str] = DEFAULT_PLAYERS,
+                   min_players: int = 3,
+                   max_players: int = 7,
+                   max_cards: int | None = None,
+                   seed: int | None = None,
+                   end: datetime | None = None,
+                   chunk_size: int = 10000) -> Iterator[Dict[str, Any]]:
+    """
+    Yield completed game records, most recent first.
+
+    Each game draws its players from `player_pool`, plays the full
+    `round_sequence` for its player count with dealer rotation, tricks
+    summing to the hand size and bids respecting the dealer rule.
+
+    Args:
+        num_games: number of games to generate
+        player_pool: names to draw each game's players from
+        min_players: smallest number of players in a game
+        max_players: largest number of players in a game
+        max_cards: max cards per hand (default depends on player count);
+            must fit a 52-card deck for `max_players` players
+        seed: seed for reproducible output
+        end: completion time of the most recent game (default now, or
+            SEEDED_END when a seed is given)
+        chunk_size: number of games sampled per vectorized batch
+    """
+    if not MIN_PLAYERS <= min_players <= max_players <= MAX_PLAYERS:
+        raise ValueError(f"Player counts must be between {MIN_PLAYERS} and {MAX_PLAYERS}")
+    if max_players > len(player_pool):
+        raise ValueError(f"Need at least {max_players} names in the player pool")
+    if max_cards is not None:
+        if max_cards < 1:
+            raise ValueError("max_cards must be at least 1")
+        if max_cards * max_players > DECK_SIZE:
+            raise ValueError(f"max_cards {max_cards} needs {max_cards * max_players} cards "
+                             f"for {max_players} players, more than a {DECK_SIZE}-card deck")
+
+    # Settings are checked above when called; games are generated lazily
+    return _generate_games(num_games, player_pool, min_players, max_players,
+                           max_cards, seed, end, chunk_size)
+
+
+def _generate_games(num_games, player_pool, min_players, max_players,
+                    max_cards, seed, end, chunk_size):
+    """Yield game records in vectorized chunks."""
+    rng = np.random.default_rng(seed)
+    pool = np.array(player_pool, dtype=object)
+    completed_at = end or (SEEDED_END if seed is not None else datetime.now())
+
+    for chunk_start in range(0, num_games, chunk_size):
+        n = min(chunk_size, num_games - chunk_start)
+        player_counts = rng.integers(min_players, max_players + 1, size=n)
+        # Games finish between 20 minutes and 3 days apart
+        gaps = rng.integers(20 * 60, 3 * 86400, size=n).cumsum()
+
+        records = [None] * n
+        for num_players in np.unique(player_counts):
+            indices = np.nonzero(player_counts == num_players)[0]
+            group = _generate_group(rng, pool, int(num_players), len(indices), max_cards)
+            for i, record in zip(indices.tolist(), group):
+                records[i] = record
+
+        for record, gap in zip(records, gaps.tolist()):
+            timestamp = completed_at - timedelta(seconds=gap)
+            record['id'] = timestamp.isoformat(timespec='microseconds')
+            record['completed_at'] = timestamp.strftime('%Y-%m-%d %H:%M:%S')
+            yield record
+        completed_at -= timedelta(seconds=int(gaps[-1]))
+
+
+def _generate_group(rng, pool, num_players, num_games, max_cards):
+    """Sample games that all share a player count, returning history records."""
+    template = OhHellGame([str(i) for i in range(num_players)], max_cards)
+    hand_sizes = np.array(template.round_sequence)
+    num_rounds = len(hand_sizes)
+
+    # Random rosters, seated in draw order
+    seats = np.argsort(rng.random((num_games, len(pool))), axis=1)[:, :num_players]
+    rosters = pool[seats]
+
+    # Deal tricks so each round sums to its hand size
+    tricks = rng.multinomial(np.broadcast_to(hand_sizes, (num_games, num_rounds)),
+                             [1 / num_players] * num_players)
+
+    # Bid close to the tricks actually won
+    errors = rng.choice([-1, 0, 1], size=tricks.shape, p=BID_ERROR_PROBS)
+    bids = np.clip(tricks + errors, 0, hand_sizes[None, :, None])
+
+    # Dealer rule: move the dealer's bid by one wherever the bids total the hand size
+    dealers = np.arange(num_rounds) % num_players
+    games, rounds = np.nonzero(bids.sum(axis=2) == hand_sizes)
+    dealer_bids = bids[games, rounds, dealers[rounds]]
+    bids[games, rounds, dealers[rounds]] = np.where(dealer_bids > 0, dealer_bids - 1, dealer_bids + 1)
+
+    round_scores = np.where(bids == tricks, 5 + tricks, -np.abs(bids - tricks))
+    final_scores = round_scores.sum(axis=1)
+    winners = final_scores.argmax(axis=1)
+
+    records = []
+    hand_sizes = hand_sizes.tolist()
+    dealers = dealers.tolist()
+    for players, game_bids, game_tricks, game_scores, totals, winner in zip(
+            rosters.tolist(), bids.tolist(), tricks.tolist(), round_scores.tolist(),
+            final_scores.tolist(), winners.tolist()):
+        rounds = [{
+            'round_num': r + 1,
+            'hand_size': hand_sizes[r],
+            'dealer': players[dealers[r]],
+            'bids': dict(zip(players, game_bids[r])),
+            'tricks': dict(zip(players, game_tricks[r])),
+            'round_scores': dict(zip(players, game_scores[r]))
+        } for r in range(num_rounds)]
+        records.append({
+            'players': players,
+            'final_scores': dict(zip(players, totals)),
+            'rounds': rounds,
+            'max_cards': template.max_cards,
+            'total_rounds': num_rounds,
+            'winner': players[winner]
+        })
+    return records
+
+
+def write_history(num_games: int, path: str, **kwargs) -> int:
+    """
+    Stream generated games into a history file, replacing its contents.
+
+    Keyword arguments are passed to generate_games. Unlike
+    save_completed_game, the history is not capped at 100 games.
+
+    Returns:
+        The number of games written
+    """
+    # Validate settings before the file is truncated
+    games = generate_games(num_games, **kwargs)
+    count = 0
+    with open(path, 'w') as f:
+        f.write('[')
+        for record in games:
+            if count:
+                f.write(',\n')
+            f.write(json.dumps(record))
+            count += 1
+        f.write(']\n')
+    return count
+
+
+def main(argv=None):
+    """Generate synthetic games into a history file."""
+    parser = argparse.ArgumentParser(description="Generate synthetic Oh Hell games")
+    parser.add_argument('num_games', type=int, help="number of games to generate")
+    parser.add_argument('-o', '--output', required=True,
+                        help="history file to write (replaced if it exists)")
+    parser.add_argument('--seed', type=int, default=None, help="random seed")
+    parser.add_argument('--min-players', type=int, default=3)
+    parser.add_argument('--max-players', type=int, default=7)
+    parser.add_argument('--max-cards', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    try:
+        count = write_history(args.num_games, args.output, seed=args.seed,
+                              min_players=args.min_players, max_players=args.max_players,
+                              max_cards=args.max_cards)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"Wrote {count} games to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
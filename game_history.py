@@ -2,15 +2,31 @@
 Game History Storage Module
 Stores completed games for later retrieval
 """
+import copy
 import json
 import os
+import threading
+from bisect import bisect_left, bisect_right, insort
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
 
 HISTORY_FILE = 'game_history.json'
 
+# In-memory indexes over the history file, rebuilt whenever the file changes
+_index: Dict[str, Any] | None = None
+_index_key: tuple | None = None
+# Guards the indexes and history read-modify-write cycles across request threads
+_index_lock = threading.RLock()
+
 def save_completed_game(game_data: Dict[str, Any]) -> str:
     """Save a completed game to history."""
+    with _index_lock:
+        return _save_completed_game(game_data)
+
+def _save_completed_game(game_data: Dict[str, Any]) -> str:
+    """Save a completed game to history while holding the index lock."""
+    global _index
+    index = _get_index()
     history = load_game_history()
     
     # Add metadata
@@ -28,9 +44,20 @@ def save_completed_game(game_data: Dict[str, Any]) -> str:
     history.insert(0, game_record)  # Most recent first
     
     # Keep last 100 games
+    dropped = history[100:]
     history = history[:100]
     
     _save_history(history)
+    
+    if len(dropped) > len(history):
+        # Trimming a large history: rebuilding beats removing games one by one
+        _index = _build_index([copy.deepcopy(game_record), *history[1:]])
+    else:
+        _index_game(index, copy.deepcopy(game_record))
+        for game in dropped:
+            _unindex_game(index, game['id'])
+    _mark_index_current()
+    
     return game_record['id']
 
 def load_game_history() -> List[Dict[str, Any]]:
@@ -46,22 +73,69 @@ def load_game_history() -> List[Dict[str, Any]]:
 
 def get_game_by_id(game_id: str) -> Dict[str, Any] | None:
     """Get a specific game from history."""
-    history = load_game_history()
-    for game in history:
-        if game['id'] == game_id:
-            return game
-    return None
+    with _index_lock:
+        game = _get_index()['by_id'].get(game_id)
+        return copy.deepcopy(game) if game else None
+
+def query_games(player: str | None = None,
+                opponents: Iterable[str] | None = None,
+                start: str | None = None,
+                end: str | None = None,
+                player_count: int | None = None) -> List[Dict[str, Any]]:
+    """
+    Find completed games matching all given filters, most recent first.
+        
+    Returned games are copies, so callers may modify them freely.
+        
+    Args:
+        player: name of a player who took part
+        opponents: names of other players who must also have taken part
+        start: earliest completion date or timestamp (inclusive)
+        end: latest completion date or timestamp (inclusive)
+        player_count: exact number of players in the game
+    """
+    with _index_lock:
+        index = _get_index()
+        # Pad the upper bound so a bare date includes the whole day
+        end = end + '\uffff' if end is not None else None
+        
+        # Participant and player count filters, smallest set first
+        id_sets = [index['by_player'].get(name, set())
+                   for name in [player, *(opponents or [])] if name is not None]
+        if player_count is not None:
+            id_sets.append(index['by_count'].get(player_count, set()))
+        id_sets.sort(key=len)
+        
+        by_date = index['by_date']
+        lo = bisect_left(by_date, (start,)) if start is not None else 0
+        hi = bisect_right(by_date, (end,)) if end is not None else len(by_date)
+        
+        # Walk whichever is smaller: the matching ids or the date range slice
+        if id_sets and len(id_sets[0]) < hi - lo:
+            games = [index['by_id'][game_id] for game_id in id_sets[0].intersection(*id_sets[1:])]
+            games = [g for g in games
+                     if (start is None or g['completed_at'] >= start)
+                     and (end is None or g['completed_at'] <= end)]
+            games = sorted(games, key=lambda g: (g['completed_at'], g['id']), reverse=True)
+        else:
+            games = [index['by_id'][game_id] for _, game_id in reversed(by_date[lo:hi])
+                     if all(game_id in ids for ids in id_sets)]
+        return copy.deepcopy(games)
 
 def delete_game(game_id: str) -> bool:
     """Delete a game from history."""
-    history = load_game_history()
-    original_length = len(history)
-    history = [g for g in history if g['id'] != game_id]
-    
-    if len(history) < original_length:
-        _save_history(history)
-        return True
-    return False
+    with _index_lock:
+        index = _get_index()
+        history = load_game_history()
+        original_length = len(history)
+        history = [g for g in history if g['id'] != game_id]
+        
+        if len(history) < original_length:
+            _save_history(history)
+            _unindex_game(index, game_id)
+            _mark_index_current()
+            return True
+        return False
 
 def _get_winner(scores: Dict[str, int]) -> str:
     """Determine the winner (highest score)."""
@@ -73,3 +147,66 @@ def _save_history(history: List[Dict[str, Any]]):
     """Save history to file."""
     with open(HISTORY_FILE, 'w') as f:
         json.dump(history, f, indent=2)
+
+def _get_index() -> Dict[str, Any]:
+    """Return the history indexes, rebuilding them if the file has changed."""
+    global _index, _index_key
+    with _index_lock:
+        key = _history_file_key()
+        if _index is None or _index_key != key:
+            # Build fully before publishing so no one sees a half-built index
+            index = _build_index(load_game_history())
+            _index, _index_key = index, key
+        return _index
+
+def _build_index(history: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build fresh indexes over a list of games."""
+    index = {'by_id': {}, 'by_player': {}, 'by_count': {}, 'by_date': []}
+    for game in history:
+        game_id = game['id']
+        index['by_id'][game_id] = game
+        for name in game['players']:
+            index['by_player'].setdefault(name, set()).add(game_id)
+        index['by_count'].setdefault(len(game['players']), set()).add(game_id)
+        index['by_date'].append((game['completed_at'], game_id))
+    index['by_date'].sort()
+    return index
+
+def _history_file_key() -> tuple:
+    """Identify the current version of the history file on disk."""
+    try:
+        stat = os.stat(HISTORY_FILE)
+    except OSError:
+        return (HISTORY_FILE, None, None)
+    return (HISTORY_FILE, stat.st_mtime_ns, stat.st_size)
+
+def _mark_index_current():
+    """Record that the indexes match the history file we just wrote."""
+    global _index_key
+    _index_key = _history_file_key()
+
+def _index_game(index: Dict[str, Any], game: Dict[str, Any]):
+    """Add a game to the indexes."""
+    game_id = game['id']
+    index['by_id'][game_id] = game
+    for name in game['players']:
+        index['by_player'].setdefault(name, set()).add(game_id)
+    index['by_count'].setdefault(len(game['players']), set()).add(game_id)
+    insort(index['by_date'], (game['completed_at'], game_id))
+
+def _unindex_game(index: Dict[str, Any], game_id: str):
+    """Remove a game from the indexes."""
+    game = index['by_id'].pop(game_id, None)
+    if game is None:
+        return
+    for name in game['players']:
+        ids = index['by_player'][name]
+        ids.discard(game_id)
+        if not ids:
+            del index['by_player'][name]
+    count_ids = index['by_count'][len(game['players'])]
+    count_ids.discard(game_id)
+    if not count_ids:
+        del index['by_count'][len(game['players'])]
+    by_date = index['by_date']
+    del by_date[bisect_left(by_date, (game['completed_at'], game_id))]
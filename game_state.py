@@ -28,6 +28,22 @@ def load_game_state() -> Dict[str, Any] | None:
         print(f"Error loading game state: {e}")
         return None
 
+def update_round(game_id: str, round_num: int, round_data: Dict[str, Any]) -> bool:
+    """
+    Replace a single round in the saved game state.
+    
+    Returns False without writing anything if the saved state belongs to a
+    different game or doesn't have that round.
+    """
+    state = load_game_state()
+    if (not state or state.get('game_id') != game_id
+            or not 1 <= round_num <= len(state.get('rounds', []))):
+        return False
+    
+    state['rounds'][round_num - 1] = round_data
+    save_game_state(state)
+    return True
+
 def clear_game_state() -> None:
     """Clear the current game state file."""
     try:
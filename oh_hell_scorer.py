@@ -4,6 +4,16 @@ Oh Hell Score Recorder
 Tracks bids and actual tricks for the Oh Hell card game and calculates scores.
 """
 
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
 class OhHellGame:
     def __init__(self, player_names, max_cards=None):
         """Initialize a new Oh Hell game with player names and optional max cards."""
@@ -21,6 +31,7 @@ class OhHellGame:
         self.current_round_num = 1
         self.dealer_index = 0
         self.round_sequence = self._generate_round_sequence()
+        self.redo_stack = []
     
     def _generate_round_sequence(self):
         """Generate the sequence of cards per round (up and down)."""
@@ -46,6 +57,12 @@ class OhHellGame:
             tricks: dict mapping player name to actual tricks won
             trump_suit: optional trump suit for the round (not used for scoring)
         """
+        self._play_round(bids, tricks)
+        # New round data invalidates anything that was undone
+        self.redo_stack.clear()
+    
+    def _play_round(self, bids, tricks):
+        """Validate, score and record a round, then advance to the next one."""
         self._validate_players(bids, tricks)
         hand_size = self._validate_game_active()
         self._validate_bids(bids, hand_size)
@@ -84,11 +101,11 @@ class OhHellGame:
         if total_tricks != hand_size:
             raise ValueError(f"Total tricks must equal {hand_size}, got {total_tricks}")
     
-    def _validate_dealer_rule(self, bids, hand_size):
+    def _validate_dealer_rule(self, bids, hand_size, dealer=None):
         """Check 'screw the dealer' rule - total bids cannot equal hand size."""
         total_bids = sum(bids.values())
         if total_bids == hand_size:
-            dealer = self.get_current_dealer()
+            dealer = dealer or self.get_current_dealer()
             raise ValueError(f"Invalid: Total bids cannot equal {hand_size} (Dealer {dealer} must bid differently)")
     
     def _calculate_round_scores(self, bids, tricks):
@@ -140,8 +157,65 @@ class OhHellGame:
         # Rotate dealer backwards
         self.dealer_index = (self.dealer_index - 1) % self.num_players
         
+        # Keep it around so it can be redone
+        self.redo_stack.append(last_round)
+        
         return last_round  # Return the undone round for potential re-editing
     
+    def redo_round(self):
+        """Re-apply the most recently undone round."""
+        if not self.redo_stack:
+            raise ValueError("No rounds to redo")
+        
+        round_data = self.redo_stack[-1]
+        self._play_round(round_data['bids'], round_data['tricks'])
+        self.redo_stack.pop()
+        
+        return self.rounds[-1]
+    
+    def edit_round(self, round_num, bids, tricks):
+        """
+        Replace the bids and tricks of an earlier round.
+        
+        Only the edited round is re-validated; cumulative scores are updated
+        by the difference between the old and new round scores.
+        
+        Args:
+            round_num: 1-based number of the round to edit
+            bids: dict mapping player name to bid
+            tricks: dict mapping player name to actual tricks won
+        
+        Returns:
+            The round data as it was before the edit
+        """
+        if not isinstance(round_num, int) or isinstance(round_num, bool):
+            raise ValueError("Round number must be an integer")
+        if not 1 <= round_num <= len(self.rounds):
+            raise ValueError(f"Round {round_num} has not been played")
+        
+        round_data = self.rounds[round_num - 1]
+        hand_size = round_data['hand_size']
+        self._validate_players(bids, tricks)
+        self._validate_bids(bids, hand_size)
+        self._validate_tricks(tricks, hand_size)
+        self._validate_dealer_rule(bids, hand_size, round_data['dealer'])
+        
+        previous_round = {
+            **round_data,
+            'bids': round_data['bids'].copy(),
+            'tricks': round_data['tricks'].copy(),
+            'round_scores': round_data['round_scores'].copy()
+        }
+        
+        for player in self.players:
+            new_score = self._calculate_player_score(bids[player], tricks[player])
+            self.scores[player] += new_score - round_data['round_scores'][player]
+            round_data['round_scores'][player] = new_score
+        round_data['bids'] = bids.copy()
+        round_data['tricks'] = tricks.copy()
+        
+        return previous_round
+    
     def get_current_scores(self):
         """Return current cumulative scores."""
         return self.scores.copy()
@@ -190,7 +264,7 @@ class OhHellGame:
         print("=" * 80 + "\n")
 
 
-def main():
+def run_interactive():
     """Interactive Oh Hell score recorder."""
     print("Welcome to Oh Hell Score Recorder!")
     print("="*80)
@@ -245,5 +319,261 @@ def main():
     game.print_scorecard()
 
 
+def load_games(path):
+    """
+    Yield (source, game, error) for each game in a JSON, NDJSON or CSV file.
+    
+    JSON files hold one game object or a list of them, NDJSON files one game
+    object per line. A game object has 'players', optional 'max_cards' and
+    'rounds' with 'bids' and 'tricks' per round, so saved history records
+    can be scored directly. CSV files have one row per player per round with
+    columns game, round, player, bid, tricks and optional max_cards.
+    
+    Records that can't be parsed are yielded with game None and an error
+    message, so the rest of the file is still read.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, newline='') as f:
+        if extension == '.csv':
+            yield from _load_csv_games(path, f)
+        elif extension in ('.ndjson', '.jsonl'):
+            for line_num, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield f"{path}:{line_num}", json.loads(line), None
+                except json.JSONDecodeError as e:
+                    yield f"{path}:{line_num}", None, f"Invalid JSON: {e}"
+        else:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                yield path, None, f"Invalid JSON: {e}"
+                return
+            if isinstance(data, list):
+                for game_num, game in enumerate(data, 1):
+                    yield f"{path}#{game_num}", game, None
+            else:
+                yield path, data, None
+
+
+def _load_csv_games(path, f):
+    """Group CSV rows into games, keeping players in order of first appearance."""
+    games = {}
+    for row_num, row in enumerate(csv.DictReader(f), 2):
+        game = games.setdefault(row.get('game') or '', {'players': [], 'rounds': {}, 'error': None})
+        if game['error']:
+            continue
+        try:
+            player = row['player']
+            round_num = int(row['round'])
+            bid = int(row['bid'])
+            tricks = int(row['tricks'])
+            if row.get('max_cards'):
+                game['max_cards'] = int(row['max_cards'])
+        except KeyError as e:
+            game['error'] = f"Row {row_num}: missing column {e}"
+            continue
+        except (TypeError, ValueError) as e:
+            game['error'] = f"Row {row_num}: {e}"
+            continue
+        
+        if player not in game['players']:
+            game['players'].append(player)
+        round_data = game['rounds'].setdefault(round_num, {'bids': {}, 'tricks': {}})
+        if player in round_data['bids']:
+            game['error'] = f"Row {row_num}: duplicate entry for {player} in round {round_num}"
+            continue
+        round_data['bids'][player] = bid
+        round_data['tricks'][player] = tricks
+    
+    for game_name, game in games.items():
+        source = f"{path}#{game_name}" if game_name else path
+        error = game.pop('error')
+        round_nums = sorted(game['rounds'])
+        if not error and round_nums != list(range(1, len(round_nums) + 1)):
+            error = f"Rounds must be numbered 1 to {len(round_nums)}, got {round_nums}"
+        if error:
+            yield source, None, error
+        else:
+            game['rounds'] = [{'round_num': n, **game['rounds'][n]} for n in round_nums]
+            yield source, game, None
+
+
+def _validate_game_spec(game_spec):
+    """Check that a recorded game has the shape OhHellGame expects."""
+    if not isinstance(game_spec, dict):
+        raise ValueError("Game must be an object")
+    players = game_spec.get('players')
+    if not isinstance(players, list) or not players:
+        raise ValueError("'players' must be a non-empty list")
+    if not all(isinstance(p, str) for p in players):
+        raise ValueError("Player names must be strings")
+    if len(set(players)) != len(players):
+        raise ValueError("Player names must be unique")
+    if not isinstance(game_spec.get('rounds'), list):
+        raise ValueError("'rounds' must be a list")
+    max_cards = game_spec.get('max_cards')
+    if max_cards is not None and (not isinstance(max_cards, int) or max_cards < 1):
+        raise ValueError("'max_cards' must be a positive integer")
+    
+    for round_num, round_data in enumerate(game_spec['rounds'], 1):
+        # Recorded round numbers must line up with the round sequence
+        if isinstance(round_data, dict) and round_data.get('round_num', round_num) != round_num:
+            raise ValueError(f"Round {round_data['round_num']} recorded in position {round_num}; "
+                             f"rounds must be numbered 1 to {len(game_spec['rounds'])}")
+        for field in ('bids', 'tricks'):
+            values = round_data.get(field) if isinstance(round_data, dict) else None
+            if not isinstance(values, dict) or not all(
+                    isinstance(v, int) and not isinstance(v, bool) for v in values.values()):
+                raise ValueError(f"Round {round_num}: '{field}' must map players to integers")
+
+
+def score_game(source, game_spec, output_format='json'):
+    """
+    Validate and score one recorded game.
+    
+    Returns:
+        (source, output, error) where output is the scored game as a JSON line
+        or a printed scorecard, and error is None unless the game was invalid
+    """
+    try:
+        _validate_game_spec(game_spec)
+        game = OhHellGame(game_spec['players'], game_spec.get('max_cards'))
+        for round_num, round_data in enumerate(game_spec['rounds'], 1):
+            try:
+                game.add_round(round_data['bids'], round_data['tricks'])
+            except ValueError as e:
+                raise ValueError(f"Round {round_num}: {e}") from e
+        
+        if output_format == 'scorecard':
+            buffer = io.StringIO()
+            with redirect_stdout(buffer):
+                print(f"\n{source}")
+                game.print_scorecard()
+            return source, buffer.getvalue(), None
+        
+        return source, json.dumps({
+            'source': source,
+            'players': game.players,
+            'max_cards': game.max_cards,
+            'scores': game.get_current_scores(),
+            'rounds': game.rounds
+        }), None
+    except ValueError as e:
+        return source, None, str(e)
+    except Exception as e:
+        # Anything unexpected still only fails this game
+        return source, None, f"{type(e).__name__}: {e}"
+
+
+def _score_chunk(chunk):
+    """Score a list of (source, game, error, output_format) in a worker process."""
+    return [score_game(source, game_spec, output_format) if error is None
+            else (source, None, error)
+            for source, game_spec, error, output_format in chunk]
+
+
+def _chunked(items, size):
+    """Lazily group an iterable into lists of at most `size` items."""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _bounded_map(executor, fn, items, max_pending):
+    """Like executor.map, but with at most `max_pending` tasks submitted at once."""
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def run_batch(paths, output_format='json', jobs=None, out=None, err=None, chunk_size=64):
+    """
+    Score every game in the given files and stream the results.
+    
+    Games are read lazily and scored in chunks across a process pool of
+    `jobs` workers (all cores by default), with at most two chunks per worker
+    in flight. Invalid games and unreadable files are reported to `err`
+    (default stderr); scored games go to `out` (default stdout).
+    
+    Returns:
+        The number of games or files that could not be scored
+    """
+    out = out or sys.stdout
+    err = err or sys.stderr
+    
+    def game_args():
+        for path in paths:
+            try:
+                for source, game_spec, error in load_games(path):
+                    yield source, game_spec, error, output_format
+            except (OSError, UnicodeDecodeError, csv.Error) as e:
+                yield path, None, str(e), output_format
+    
+    counts = {'scored': 0, 'failed': 0}
+    
+    def report(chunk_results):
+        for results in chunk_results:
+            for source, output, error in results:
+                if error is not None:
+                    counts['failed'] += 1
+                    print(f"ERROR {source}: {error}", file=err)
+                else:
+                    counts['scored'] += 1
+                    print(output, file=out)
+                if (counts['scored'] + counts['failed']) % 1000 == 0:
+                    print(f"Processed {counts['scored'] + counts['failed']} games...", file=err)
+    
+    jobs = jobs or os.cpu_count() or 1
+    chunks = _chunked(game_args(), chunk_size)
+    if jobs == 1:
+        report(map(_score_chunk, chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            report(_bounded_map(executor, _score_chunk, chunks, jobs * 2))
+    
+    print(f"Scored {counts['scored']} games, {counts['failed']} failed", file=err)
+    return counts['failed']
+
+
+def _positive_int(value):
+    """Parse a command line argument as an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def main(argv=None):
+    """Run the interactive recorder, or score game files in batch mode."""
+    parser = argparse.ArgumentParser(description="Oh Hell Score Recorder")
+    parser.add_argument('files', nargs='*',
+                        help="JSON, NDJSON or CSV game files to score (interactive if omitted)")
+    parser.add_argument('--format', choices=['json', 'scorecard'], default='json',
+                        help="output scored games as JSON lines or printed scorecards")
+    parser.add_argument('-j', '--jobs', type=_positive_int, default=None,
+                        help="number of worker processes (default: all cores)")
+    args = parser.parse_args(argv)
+    
+    if not args.files:
+        run_interactive()
+        return 0
+    
+    return 1 if run_batch(args.files, args.format, args.jobs) else 0
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
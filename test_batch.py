@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test batch scoring of game files
+"""
+
+import io
+import json
+import os
+import tempfile
+
+import pytest
+
+from oh_hell_scorer import main, run_batch
+
+ROUNDS = [
+    {"bids": {"Alice": 1, "Bob": 1, "Carol": 0}, "tricks": {"Alice": 1, "Bob": 0, "Carol": 0}},
+    {"bids": {"Alice": 1, "Bob": 0, "Carol": 0}, "tricks": {"Alice": 1, "Bob": 0, "Carol": 1}},
+]
+
+def test_run_batch():
+    """Test scoring JSON, NDJSON and CSV files with error reporting."""
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, 'games.json')
+        with open(json_path, 'w') as f:
+            json.dump([{"players": ["Alice", "Bob", "Carol"], "rounds": ROUNDS}], f)
+        
+        ndjson_path = os.path.join(tmp, 'games.ndjson')
+        with open(ndjson_path, 'w') as f:
+            f.write(json.dumps({"players": ["Alice", "Bob", "Carol"], "rounds": ROUNDS[:1]}) + "\n")
+            # Bids total the hand size, breaking the dealer rule
+            f.write(json.dumps({"players": ["Alice", "Bob", "Carol"], "rounds": ROUNDS[1:]}) + "\n")
+        
+        csv_path = os.path.join(tmp, 'games.csv')
+        with open(csv_path, 'w') as f:
+            f.write("game,round,player,bid,tricks\n")
+            for round_num, round_data in enumerate(ROUNDS, 1):
+                for player in ["Alice", "Bob", "Carol"]:
+                    f.write(f"g1,{round_num},{player},"
+                            f"{round_data['bids'][player]},{round_data['tricks'][player]}\n")
+        
+        out, err = io.StringIO(), io.StringIO()
+        failed = run_batch([json_path, ndjson_path, csv_path], jobs=2, out=out, err=err)
+        
+        results = [json.loads(line) for line in out.getvalue().splitlines()]
+        print(err.getvalue())
+        
+        assert failed == 1
+        assert [r['source'] for r in results] == [
+            f"{json_path}#1", f"{ndjson_path}:1", f"{csv_path}#g1"
+        ]
+        assert results[0]['scores'] == {"Alice": 12, "Bob": 4, "Carol": 4}
+        assert results[2]['scores'] == results[0]['scores']
+        assert f"ERROR {ndjson_path}:2: Round 1" in err.getvalue()
+    
+    print("✓ Batch test complete!")
+
+def test_run_batch_bad_records():
+    """Test that malformed records only fail themselves, not the rest of the batch."""
+    good = {"players": ["Alice", "Bob", "Carol"], "rounds": ROUNDS}
+    with tempfile.TemporaryDirectory() as tmp:
+        ndjson_path = os.path.join(tmp, 'games.ndjson')
+        with open(ndjson_path, 'w') as f:
+            f.write(json.dumps(good) + "\n")
+            f.write('{"players": ["Alice", "Bob"\n')
+            f.write(json.dumps({"players": [], "rounds": []}) + "\n")
+            f.write(json.dumps({"players": ["Alice", "Bob", "Carol"],
+                                "rounds": [{"bids": [1, 1, 0], "tricks": [1, 0, 0]}]}) + "\n")
+            f.write(json.dumps(good) + "\n")
+        
+        json_path = os.path.join(tmp, 'games.json')
+        with open(json_path, 'w') as f:
+            json.dump([good, "not a game", good], f)
+        
+        csv_path = os.path.join(tmp, 'games.csv')
+        with open(csv_path, 'w') as f:
+            f.write("game,round,player,bid,tricks\n")
+            for game_name in ["g1", "g2", "g3"]:
+                for player in ["Alice", "Bob", "Carol"]:
+                    bid = ROUNDS[0]['bids'][player] if game_name != "g2" or player != "Bob" else "x"
+                    f.write(f"{game_name},1,{player},{bid},{ROUNDS[0]['tricks'][player]}\n")
+        
+        for jobs in (1, 2):
+            out, err = io.StringIO(), io.StringIO()
+            failed = run_batch([ndjson_path, json_path, csv_path], jobs=jobs,
+                               out=out, err=err, chunk_size=2)
+            
+            sources = [json.loads(line)['source'] for line in out.getvalue().splitlines()]
+            errors = err.getvalue()
+            print(errors)
+            
+            assert failed == 5
+            assert sources == [
+                f"{ndjson_path}:1", f"{ndjson_path}:5",
+                f"{json_path}#1", f"{json_path}#3",
+                f"{csv_path}#g1", f"{csv_path}#g3"
+            ]
+            assert f"ERROR {ndjson_path}:2: Invalid JSON" in errors
+            assert f"ERROR {ndjson_path}:3: 'players' must be a non-empty list" in errors
+            assert f"ERROR {ndjson_path}:4: Round 1: 'bids' must map players to integers" in errors
+            assert f"ERROR {json_path}#2: Game must be an object" in errors
+            assert f"ERROR {csv_path}#g2: Row 6:" in errors
+            assert "Scored 6 games, 5 failed" in errors
+    
+    print("✓ Batch bad record test complete!")
+
+def test_run_batch_inconsistent_records():
+    """Test that gaps, duplicates and bad player lists are rejected."""
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'games.csv')
+        with open(csv_path, 'w') as f:
+            f.write("game,round,player,bid,tricks\n")
+            # gap: rounds 1 and 3 only
+            for round_num in (1, 3):
+                for player in ["Alice", "Bob", "Carol"]:
+                    f.write(f"gap,{round_num},{player},0,{1 if player == 'Alice' else 0}\n")
+            # dup: Bob recorded twice in round 1
+            for player in ["Alice", "Bob", "Bob", "Carol"]:
+                f.write(f"dup,1,{player},0,{1 if player == 'Alice' else 0}\n")
+        
+        ndjson_path = os.path.join(tmp, 'games.ndjson')
+        with open(ndjson_path, 'w') as f:
+            f.write(json.dumps({"players": ["Alice", "Alice", "Bob"], "rounds": []}) + "\n")
+            f.write(json.dumps({"players": ["Alice", 2, "Bob"], "rounds": []}) + "\n")
+            f.write(json.dumps({"players": ["Alice", "Bob", "Carol"],
+                                "rounds": [dict(ROUNDS[0], round_num=2)]}) + "\n")
+        
+        out, err = io.StringIO(), io.StringIO()
+        failed = run_batch([csv_path, ndjson_path], jobs=1, out=out, err=err)
+        errors = err.getvalue()
+        print(errors)
+        
+        assert failed == 5
+        assert out.getvalue() == ""
+        assert f"ERROR {csv_path}#gap: Rounds must be numbered 1 to 2, got [1, 3]" in errors
+        assert f"ERROR {csv_path}#dup: Row 10: duplicate entry for Bob in round 1" in errors
+        assert f"ERROR {ndjson_path}:1: Player names must be unique" in errors
+        assert f"ERROR {ndjson_path}:2: Player names must be strings" in errors
+        assert f"ERROR {ndjson_path}:3: Round 2 recorded in position 1" in errors
+    
+    print("✓ Batch inconsistent record test complete!")
+
+def test_jobs_must_be_positive():
+    """Test that -j rejects zero and negative worker counts."""
+    for jobs in ('0', '-1', 'many'):
+        with pytest.raises(SystemExit):
+            main(['-j', jobs, 'games.json'])
+
+if __name__ == "__main__":
+    test_run_batch()
+    test_run_batch_bad_records()
+    test_run_batch_inconsistent_records()
+    test_jobs_must_be_positive()
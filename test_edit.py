@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test edit and redo functionality
+"""
+
+import os
+import tempfile
+
+import game_state
+from oh_hell_scorer import OhHellGame
+
+def test_edit_round():
+    """Test editing an earlier round."""
+    print("Testing edit feature...\n")
+    
+    game = OhHellGame(["Alice", "Bob", "Carol"], max_cards=5)
+    game.add_round(
+        bids={"Alice": 1, "Bob": 0, "Carol": 1},
+        tricks={"Alice": 1, "Bob": 0, "Carol": 0}
+    )
+    game.add_round(
+        bids={"Alice": 1, "Bob": 0, "Carol": 0},
+        tricks={"Alice": 1, "Bob": 0, "Carol": 1}
+    )
+    print(f"  Scores before edit: {game.get_current_scores()}")
+    
+    # Fix round 1: Bob and Carol's bids were swapped
+    previous = game.edit_round(
+        1,
+        bids={"Alice": 1, "Bob": 1, "Carol": 0},
+        tricks={"Alice": 1, "Bob": 0, "Carol": 0}
+    )
+    print(f"  Scores after edit: {game.get_current_scores()}\n")
+    
+    assert previous['bids']['Carol'] == 1
+    assert game.rounds[0]['round_scores'] == {"Alice": 6, "Bob": -1, "Carol": 5}
+    assert game.get_current_scores() == {"Alice": 12, "Bob": 4, "Carol": 4}
+    assert game.current_round_num == 3
+    
+    # Dealer rule is checked against the edited round's dealer
+    try:
+        game.edit_round(
+            1,
+            bids={"Alice": 1, "Bob": 0, "Carol": 0},
+            tricks={"Alice": 1, "Bob": 0, "Carol": 0}
+        )
+        assert False, "Expected dealer rule to fail"
+    except ValueError as e:
+        print(f"  Rejected invalid edit: {e}")
+    assert game.get_current_scores() == {"Alice": 12, "Bob": 4, "Carol": 4}
+    
+    # Round numbers must be real integers
+    for round_num in ("1", True, 1.0):
+        try:
+            game.edit_round(round_num, bids={"Alice": 1, "Bob": 1, "Carol": 0},
+                            tricks={"Alice": 1, "Bob": 0, "Carol": 0})
+            assert False, f"Expected round number {round_num!r} to be rejected"
+        except ValueError as e:
+            assert str(e) == "Round number must be an integer"
+    
+    print("✓ Edit test complete!")
+
+def test_redo_rounds():
+    """Test undoing and redoing several rounds."""
+    game = OhHellGame(["Alice", "Bob", "Carol"], max_cards=5)
+    game.add_round(
+        bids={"Alice": 1, "Bob": 0, "Carol": 1},
+        tricks={"Alice": 1, "Bob": 0, "Carol": 0}
+    )
+    game.add_round(
+        bids={"Alice": 1, "Bob": 0, "Carol": 0},
+        tricks={"Alice": 1, "Bob": 0, "Carol": 1}
+    )
+    scores = game.get_current_scores()
+    
+    game.undo_last_round()
+    game.undo_last_round()
+    assert game.get_current_scores() == {"Alice": 0, "Bob": 0, "Carol": 0}
+    
+    game.redo_round()
+    game.redo_round()
+    assert game.get_current_scores() == scores
+    assert game.current_round_num == 3
+    assert game.get_current_dealer() == "Carol"
+    
+    # Adding a new round clears anything left to redo
+    game.undo_last_round()
+    game.add_round(
+        bids={"Alice": 0, "Bob": 1, "Carol": 0},
+        tricks={"Alice": 1, "Bob": 1, "Carol": 0}
+    )
+    assert game.redo_stack == []
+    
+    print("✓ Redo test complete!")
+
+def test_update_round_checks_game_id():
+    """Test that a saved round is only patched for the matching game."""
+    with tempfile.TemporaryDirectory() as tmp:
+        original_file = game_state.GAME_STATE_FILE
+        game_state.GAME_STATE_FILE = os.path.join(tmp, 'current_game.json')
+        try:
+            game_state.save_game_state({'game_id': 'other', 'players': ["A", "B", "C"],
+                                        'rounds': [{'bids': {}, 'tricks': {}}]})
+            assert not game_state.update_round('mine', 1, {'bids': {"A": 1}, 'tricks': {}})
+            assert game_state.load_game_state()['rounds'][0]['bids'] == {}
+            
+            assert game_state.update_round('other', 1, {'bids': {"A": 1}, 'tricks': {}})
+            assert game_state.load_game_state()['rounds'][0]['bids'] == {"A": 1}
+        finally:
+            game_state.GAME_STATE_FILE = original_file
+    
+    print("✓ Saved round update test complete!")
+
+if __name__ == "__main__":
+    test_edit_round()
+    test_redo_rounds()
+    test_update_round_checks_game_id()
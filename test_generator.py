@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test synthetic game generation
+"""
+
+import os
+import tempfile
+
+import pytest
+
+pytest.importorskip('numpy')
+
+import game_generator
+import game_history
+from oh_hell_scorer import OhHellGame
+
+def test_generated_games_are_valid():
+    """Replay generated games through OhHellGame and compare scores."""
+    games = list(game_generator.generate_games(300, seed=7, chunk_size=128))
+    
+    assert len(games) == 300
+    assert len({g['id'] for g in games}) == 300
+    assert [g['completed_at'] for g in games] == sorted((g['completed_at'] for g in games), reverse=True)
+    
+    for record in games:
+        game = OhHellGame(record['players'], record['max_cards'])
+        for round_data in record['rounds']:
+            assert round_data['dealer'] == game.get_current_dealer()
+            game.add_round(round_data['bids'], round_data['tricks'])
+        
+        assert game.get_current_hand_size() is None
+        assert game.get_current_scores() == record['final_scores']
+        assert [r['round_scores'] for r in game.rounds] == [r['round_scores'] for r in record['rounds']]
+        assert record['winner'] == game_history._get_winner(record['final_scores'])
+    
+    # Same seed, same games
+    again = list(game_generator.generate_games(300, seed=7, chunk_size=128))
+    assert again == games
+    
+    print("✓ Generator validity test complete!")
+
+def test_write_history():
+    """Test that generated games load back through the history store."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'game_history.json')
+        assert game_generator.write_history(500, path, seed=1) == 500
+        
+        # Read it back through the history store
+        original_file = game_history.HISTORY_FILE
+        game_history.HISTORY_FILE = path
+        try:
+            history = game_history.load_game_history()
+            assert len(history) == 500
+            assert game_history.get_game_by_id(history[42]['id']) == history[42]
+            assert all("Alice" in g['players'] for g in game_history.query_games(player="Alice"))
+        finally:
+            game_history.HISTORY_FILE = original_file
+    
+    print("✓ Generator history test complete!")
+
+def test_generator_rejects_unplayable_settings():
+    """Test that settings the app would not accept are rejected up front."""
+    for kwargs in ({'min_players': 1}, {'max_players': 8}, {'min_players': 5, 'max_players': 4},
+                   {'max_cards': 0}, {'max_cards': 20}, {'max_cards': 8, 'max_players': 7}):
+        with pytest.raises(ValueError):
+            game_generator.generate_games(1, **kwargs)
+    
+    # Largest deal that still fits the deck
+    game = next(game_generator.generate_games(1, seed=3, min_players=7, max_cards=7))
+    assert game['max_cards'] == 7
+    
+    print("✓ Generator settings test complete!")
+
+if __name__ == "__main__":
+    test_generated_games_are_valid()
+    test_write_history()
+    test_generator_rejects_unplayable_settings()
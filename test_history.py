@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test history queries
+"""
+
+import json
+import os
+import tempfile
+
+import game_history
+
+def _game_record(game_id, players, completed_at):
+    """Build a history record for a finished game."""
+    return {
+        'id': game_id,
+        'completed_at': completed_at,
+        'players': players,
+        'final_scores': {p: 0 for p in players},
+        'rounds': [],
+        'max_cards': 5,
+        'total_rounds': 0,
+        'winner': players[0]
+    }
+
+def test_query_games():
+    """Test filtering history by player, opponents, date and player count."""
+    with tempfile.TemporaryDirectory() as tmp:
+        original_file = game_history.HISTORY_FILE
+        game_history.HISTORY_FILE = os.path.join(tmp, 'game_history.json')
+        try:
+            first, second, third = 'g1', 'g2', 'g3'
+            game_history._save_history([
+                _game_record(third, ["Carol", "Dave", "Erin"], '2026-02-11 19:15:00'),
+                _game_record(second, ["Alice", "Dave", "Erin", "Bob"], '2026-02-10 21:30:00'),
+                _game_record(first, ["Alice", "Bob", "Carol"], '2026-01-05 20:00:00')
+            ])
+            
+            ids = lambda games: [g['id'] for g in games]
+            assert ids(game_history.query_games()) == [third, second, first]
+            assert ids(game_history.query_games(player="Alice")) == [second, first]
+            assert ids(game_history.query_games(player="Alice", opponents=["Dave"])) == [second]
+            assert ids(game_history.query_games(player_count=3)) == [third, first]
+            assert ids(game_history.query_games(start='2026-02-01')) == [third, second]
+            assert ids(game_history.query_games(end='2026-02-10')) == [second, first]
+            assert ids(game_history.query_games(player="Erin", end='2026-02-10')) == [second]
+            assert game_history.query_games(player="Zoe") == []
+            
+            latest = game_history.save_completed_game({
+                'players': ["Alice", "Carol", "Dave"],
+                'scores': {"Alice": 10, "Carol": 4, "Dave": -2},
+                'rounds': [],
+                'max_cards': 5
+            })
+            assert ids(game_history.query_games(player="Alice")) == [latest, second, first]
+            
+            assert game_history.delete_game(second)
+            assert ids(game_history.query_games(player="Alice")) == [latest, first]
+            assert game_history.get_game_by_id(second) is None
+        finally:
+            game_history.HISTORY_FILE = original_file
+    
+    print("✓ History query test complete!")
+
+def test_index_follows_external_writes():
+    """Test that the index notices other writers and is not exposed to callers."""
+    with tempfile.TemporaryDirectory() as tmp:
+        original_file = game_history.HISTORY_FILE
+        game_history.HISTORY_FILE = os.path.join(tmp, 'game_history.json')
+        try:
+            game_history._save_history([_game_record('g1', ["Alice", "Bob", "Carol"], '2026-01-05 20:00:00')])
+            assert game_history.get_game_by_id('g1') is not None
+            
+            # Mutating a result must not leak into the index
+            game_history.get_game_by_id('g1')['players'].append("Mallory")
+            game_history.query_games(player="Alice")[0]['winner'] = "Mallory"
+            assert game_history.get_game_by_id('g1') == _game_record('g1', ["Alice", "Bob", "Carol"], '2026-01-05 20:00:00')
+            
+            # Another process replaces the file
+            with open(game_history.HISTORY_FILE, 'w') as f:
+                json.dump([_game_record('g2', ["Dave", "Erin", "Frank", "Grace"], '2026-03-01 18:00:00')], f)
+            
+            assert game_history.get_game_by_id('g1') is None
+            assert [g['id'] for g in game_history.query_games(player="Dave")] == ['g2']
+        finally:
+            game_history.HISTORY_FILE = original_file
+    
+    print("✓ History index refresh test complete!")
+
+def test_save_trims_large_history():
+    """Test that saving into an oversized history leaves a consistent index."""
+    with tempfile.TemporaryDirectory() as tmp:
+        original_file = game_history.HISTORY_FILE
+        game_history.HISTORY_FILE = os.path.join(tmp, 'game_history.json')
+        try:
+            game_history._save_history([
+                _game_record(f'g{i:04d}', ["Alice", "Bob", "Carol"], f'2025-{i % 12 + 1:02d}-01 12:{i % 60:02d}:00')
+                for i in range(1000)
+            ])
+            assert len(game_history.query_games(player="Alice")) == 1000
+            
+            latest = game_history.save_completed_game({
+                'players': ["Alice", "Bob", "Carol"],
+                'scores': {"Alice": 1, "Bob": 0, "Carol": 0},
+                'rounds': [],
+                'max_cards': 5
+            })
+            
+            history_ids = [g['id'] for g in game_history.load_game_history()]
+            results = game_history.query_games(player="Alice")
+            assert len(history_ids) == 100
+            assert sorted(g['id'] for g in results) == sorted(history_ids)
+            assert results[0]['id'] == latest
+        finally:
+            game_history.HISTORY_FILE = original_file
+    
+    print("✓ History trim test complete!")
+
+if __name__ == "__main__":
+    test_query_games()
+    test_index_follows_external_writes()
+    test_save_trims_large_history()